@@ -2,31 +2,36 @@
 import re
 from pathlib import Path
 
+_GAME_RE = re.compile(r'data-game="([^"]+)"')
+_INIT_RE = re.compile(r'function\s+(init[A-Za-z0-9_]*)')
+_SPLIT_RE = re.compile(r'[^A-Za-z0-9]')
+
 root = Path('/Users/mason/Game Center Project')
 file = root / 'src' / 'core' / 'index.html'
-text = file.read_text(encoding='utf-8')
+text = file.read_bytes().decode('utf-8')
 
-games = re.findall(r'data-game="([^"]+)"', text)
-init_funcs = re.findall(r'function\s+(init[A-Za-z0-9_]*)', text)
-init_set = set(init_funcs)
+games = {m.group(1) for m in _GAME_RE.finditer(text)}
+init_set = {m.group(1) for m in _INIT_RE.finditer(text)}
 
 # helper to camelize
 def camelize(name):
-    parts = re.split(r'[^A-Za-z0-9]', name)
+    parts = _SPLIT_RE.split(name)
     return ''.join(p.capitalize() for p in parts if p)
 
 missing = []
-for g in sorted(set(games)):
-    candidates = [f'init{camelize(g)}', f'init{g.capitalize()}', f'init{g.upper()}', f'init{g}']
-    found = any(c in init_set for c in candidates)
+init_lower = tuple(f.lower() for f in init_set)
+for g in sorted(games):
+    candidates = (f'init{camelize(g)}', f'init{g.capitalize()}', f'init{g.upper()}', f'init{g}')
+    found = not init_set.isdisjoint(candidates)
     # also check known alternate names in file
     # check if any init function contains the game name lowercased
     if not found:
-        found = any(g.lower() in f.lower() for f in init_set)
+        g_low = g.lower()
+        found = any(g_low in f for f in init_lower)
     if not found:
         missing.append(g)
 
-print('Total games found:', len(set(games)))
+print('Total games found:', len(games))
 print('Total init-like functions found:', len(init_set))
 print('\nMissing games (no obvious init found):')
 for m in missing:
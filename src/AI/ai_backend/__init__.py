@@ -1,49 +1,16 @@
 # ai_backend/__init__.py
 import os
-import json
 import logging
+from collections.abc import Mapping
 
-# -----------------------
-# Import and initialize core and extra model providers
-# -----------------------
-try:
-    from .ai_models.chatgpt_model import ChatGPTModel
-except Exception:
-    # Fallback shim when optional external dependencies (like openai) are missing.
-    class ChatGPTModel:
-        def __init__(self):
-            self.name = "chatgpt-shim"
-
-        def generate(self, prompt: str) -> str:
-            return f"[chatgpt-shim] {prompt}"
-
-try:
-    from .ai_models.gemini_model import GeminiModel
-except Exception:
-    class GeminiModel:
-        def __init__(self):
-            self.name = "gemini-shim"
-
-        def generate(self, prompt: str) -> str:
-            return f"[gemini-shim] {prompt}"
-
-try:
-    from .ai_models.grok_model import GrokModel
-except Exception:
-    class GrokModel:
-        def __init__(self):
-            self.name = "grok-shim"
-
-        def generate(self, prompt: str) -> str:
-            return f"[grok-shim] {prompt}"
-
-# Extra (local simulated) models
+# Local simulated models are cheap to import. Importing this subpackage eagerly
+# also keeps it from rebinding the `models` registry defined below.
 from .models import NexusFactory, FlashModel, ProFlashModel, UltraModel, UltraFlashModel
 
 # -----------------------
 # Logging setup
 # -----------------------
-logging.basicConfig(level=logging.INFO)
+# Handlers are left to the application; entry points call logging.basicConfig
 logger = logging.getLogger("iGame-AI")
 
 # -----------------------
@@ -56,36 +23,107 @@ for folder in ["stats", "billing"]:
 # Initialize stats file
 # -----------------------
 stats_file = "stats/stats.json"
-if not os.path.exists(stats_file):
-    with open(stats_file, "w") as f:
-        json.dump({"requests": 0}, f)
+_STATS_INIT = b'{"requests": 0}'
+try:
+    with open(stats_file, "xb") as f:
+        f.write(_STATS_INIT)
+except FileExistsError:
+    pass
 
 # -----------------------
 # Ultra billing setup
 # -----------------------
 billing_file = "billing/billing.json"
-if not os.path.exists(billing_file):
-    ultra_credits = 10**12  # ultra dev mode
-    with open(billing_file, "w") as f:
-        json.dump({"credits": ultra_credits}, f)
-
-# Initialize models once for the whole backend
-_nexus_factory = NexusFactory()
-models = {
-    "chatgpt": ChatGPTModel(),
-    "gemini": GeminiModel(),
-    "grok": GrokModel(),
+ultra_credits = 10**12  # ultra dev mode
+_BILLING_INIT = ('{"credits": ' + str(ultra_credits) + '}').encode()
+try:
+    with open(billing_file, "xb") as f:
+        f.write(_BILLING_INIT)
+except FileExistsError:
+    pass
+
+# -----------------------
+# Core and extra model providers
+# -----------------------
+class _ShimModel:
+    """Fallback used when a provider's optional dependencies (like openai) are missing."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def generate(self, prompt: str) -> str:
+        return f"[{self.name}] {prompt}"
+
+
+def _load_chatgpt():
+    try:
+        from .ai_models.chatgpt_model import ChatGPTModel
+    except Exception:
+        return _ShimModel("chatgpt-shim")
+    return ChatGPTModel()
+
+
+def _load_gemini():
+    try:
+        from .ai_models.gemini_model import GeminiModel
+    except Exception:
+        return _ShimModel("gemini-shim")
+    return GeminiModel()
+
+
+def _load_grok():
+    try:
+        from .ai_models.grok_model import GrokModel
+    except Exception:
+        return _ShimModel("grok-shim")
+    return GrokModel()
+
+
+class _ModelRegistry(Mapping):
+    """Read-only mapping of model name to instance.
+
+    Providers are imported and constructed on first access and cached, so
+    importing the package does not pay for models that are never used.
+    """
+
+    def __init__(self, factories: dict):
+        self._factories = factories
+        self._instances = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._instances[key]
+        except KeyError:
+            pass
+        model = self._factories[key]()
+        self._instances[key] = model
+        return model
+
+    def __contains__(self, key):
+        return key in self._factories
+
+    def __iter__(self):
+        return iter(self._factories)
+
+    def __len__(self):
+        return len(self._factories)
+
+
+models = _ModelRegistry({
+    "chatgpt": _load_chatgpt,
+    "gemini": _load_gemini,
+    "grok": _load_grok,
 
     # Nexus factory and a couple of convenience instances
-    "nexus_factory": _nexus_factory,
-    "nexus": _nexus_factory.get("1.0"),
-    "nexus-10.5.5": _nexus_factory.get("10.5.5"),
+    "nexus_factory": NexusFactory,
+    "nexus": lambda: models["nexus_factory"].get("1.0"),
+    "nexus-10.5.5": lambda: models["nexus_factory"].get("10.5.5"),
 
     # Flash-family simulated models
-    "flash": FlashModel(),
-    "pro-flash": ProFlashModel(),
-    "ultra": UltraModel(),
-    "ultra-flash": UltraFlashModel(),
-}
+    "flash": FlashModel,
+    "pro-flash": ProFlashModel,
+    "ultra": UltraModel,
+    "ultra-flash": UltraFlashModel,
+})
 
-logger.info("iGame-AI package initialized with core and extra models loaded.")
+logger.info("iGame-AI package initialized; models load on first use.")
@@ -4,6 +4,7 @@ FastAPI server with comprehensive security enhancements
 """
 
 import sys
+import logging
 from pathlib import Path
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -13,6 +14,9 @@ from fastapi.responses import JSONResponse
 ROOT = Path(__file__).resolve().parent
 sys.path.insert(0, str(ROOT))
 
+# Configure logging before importing ai_backend so its startup messages show
+logging.basicConfig(level=logging.INFO)
+
 # Import secure orchestrator
 from ai_backend.secure_orchestrator_fixed import (
     SecureAIOrchestrator, 
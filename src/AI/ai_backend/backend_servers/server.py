@@ -1,6 +1,11 @@
 import sys
 import os
+import logging
 from pathlib import Path
+
+# Configure logging before importing ai_backend so its startup messages show
+logging.basicConfig(level=logging.INFO)
+
 from ai_backend.security.middleware import OAuth2
 
 # Add all needed modules to Python path
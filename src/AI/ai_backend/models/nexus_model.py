@@ -4,36 +4,62 @@ This provides a lightweight NexusAIModel that can be parameterized by version.
 It is deterministic and safe for tests; it does not call external services.
 """
 import hashlib
+import re
+
+_TOKEN_RE = re.compile(r"\w+|[.,!?;:]")
 
 
 class NexusAIModel:
+    __slots__ = ("version", "name", "_name_prefix")
+
     def __init__(self, version: str = "1.0"):
         self.version = str(version)
         self.name = f"nexus-{self.version}"
+        self._name_prefix = (self.name + "|").encode("utf-8")
 
     def generate(self, prompt: str) -> str:
-        seed = (self.name + "|" + prompt).encode("utf-8")
-        h = hashlib.sha256(seed).hexdigest()[:12]
+        hasher = hashlib.blake2b(self._name_prefix, digest_size=6)
+        hasher.update(prompt.encode("utf-8"))
+        h = hasher.hexdigest()
         return f"[Nexus {self.version} simulated response | id={h}] {prompt}"
 
+    def generate_batch(self, prompts: list) -> list:
+        """Generate responses for many prompts; same output as calling `generate` on each."""
+        # Hash the shared "name|" prefix once and copy the hasher state per prompt
+        base = hashlib.blake2b(self._name_prefix, digest_size=6)
+        head = f"[Nexus {self.version} simulated response | id="
+        out = []
+        append = out.append
+        for prompt in prompts:
+            hasher = base.copy()
+            hasher.update(prompt.encode("utf-8"))
+            append(f"{head}{hasher.hexdigest()}] {prompt}")
+        return out
+
     def generate_tokens(self, text: str) -> list:
         """Generate tokens by splitting on whitespace and punctuation boundaries."""
-        import re
         # Simple token generation: split on whitespace and keep punctuation
-        tokens = re.findall(r"\w+|[.,!?;:]", text)
-        return tokens if tokens else text.split()
+        tokens = _TOKEN_RE.findall(text)
+        return tokens or text.split()
 
 
 class NexusFactory:
     """Factory that produces NexusAIModel instances for requested versions.
 
-    Use `NexusFactory().get(version)` to obtain a model instance.
+    Use `NexusFactory().get(version)` to obtain a model instance. Instances are
+    cached per version, so repeated requests share the same model.
     """
+    __slots__ = ("min_version", "max_version", "_cache")
+
     def __init__(self, min_version: str = "1.0", max_version: str = "10.5.5"):
         self.min_version = min_version
         self.max_version = max_version
+        self._cache: dict[str, NexusAIModel] = {}
 
     def get(self, version: str = None) -> NexusAIModel:
-        if version is None:
-            version = self.min_version
-        return NexusAIModel(version=str(version))
+        v = str(version) if version is not None else str(self.min_version)
+        model = self._cache.get(v)
+        if model is None:
+            model = NexusAIModel(version=v)
+            self._cache[v] = model
+        return model
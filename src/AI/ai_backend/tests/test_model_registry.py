@@ -0,0 +1,62 @@
+import unittest
+from ai_backend import models, _ModelRegistry
+from ai_backend.models import NexusAIModel, NexusFactory, FlashModel
+
+EXPECTED_KEYS = [
+    "chatgpt", "gemini", "grok",
+    "nexus_factory", "nexus", "nexus-10.5.5",
+    "flash", "pro-flash", "ultra", "ultra-flash",
+]
+
+
+class TestModelRegistry(unittest.TestCase):
+    def test_keys_match_previous_dict(self):
+        self.assertEqual(list(models), EXPECTED_KEYS)
+        self.assertEqual(len(models), len(EXPECTED_KEYS))
+        self.assertEqual(list(models.keys()), EXPECTED_KEYS)
+        for key in EXPECTED_KEYS:
+            self.assertIn(key, models)
+        self.assertNotIn("unknown-model", models)
+
+    def test_get_falls_back_to_default(self):
+        self.assertIsNone(models.get("unknown-model"))
+        self.assertIs(models.get("unknown-model", models["nexus"]), models["nexus"])
+        with self.assertRaises(KeyError):
+            _ = models["unknown-model"]
+
+    def test_values_are_reused(self):
+        self.assertIs(models["flash"], models["flash"])
+        self.assertIs(models.get("nexus"), models["nexus"])
+        self.assertIsInstance(models["flash"], FlashModel)
+
+    def test_nexus_comes_from_shared_factory(self):
+        factory = models["nexus_factory"]
+        self.assertIsInstance(factory, NexusFactory)
+        self.assertIsInstance(models["nexus"], NexusAIModel)
+        self.assertIs(models["nexus"], factory.get("1.0"))
+        self.assertIs(models["nexus-10.5.5"], factory.get("10.5.5"))
+
+    def test_every_model_can_generate(self):
+        for key in EXPECTED_KEYS:
+            if key == "nexus_factory":
+                continue
+            self.assertTrue(callable(getattr(models[key], "generate", None)), key)
+
+    def test_factory_called_once_on_first_access(self):
+        calls = []
+
+        def make():
+            calls.append(1)
+            return object()
+
+        registry = _ModelRegistry({"m": make})
+        self.assertEqual(calls, [])
+        self.assertIn("m", registry)
+        self.assertEqual(calls, [])
+        first = registry["m"]
+        self.assertIs(registry.get("m"), first)
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from ai_backend.models.nexus_model import NexusAIModel, NexusFactory
+
+
+class TestNexusAIModel(unittest.TestCase):
+    def test_generate_batch_matches_generate(self):
+        m = NexusAIModel("10.5.5")
+        prompts = ["hello", "", "Solve 3x + 5 = 20", "héllo wörld", "日本語のプロンプト", "emoji 🎮"]
+        self.assertEqual(m.generate_batch(prompts), [m.generate(p) for p in prompts])
+
+    def test_generate_batch_empty(self):
+        self.assertEqual(NexusAIModel().generate_batch([]), [])
+
+    def test_generate_is_deterministic_per_version(self):
+        a = NexusAIModel("1.0")
+        self.assertEqual(a.generate("x"), NexusAIModel("1.0").generate("x"))
+        self.assertNotEqual(a.generate("x"), NexusAIModel("2.0").generate("x"))
+
+
+class TestNexusFactory(unittest.TestCase):
+    def test_get_returns_cached_instance(self):
+        f = NexusFactory()
+        m = f.get("1.0")
+        self.assertIsInstance(m, NexusAIModel)
+        self.assertIs(f.get("1.0"), m)
+
+    def test_version_normalized_before_caching(self):
+        f = NexusFactory()
+        self.assertIs(f.get(1.0), f.get("1.0"))
+        self.assertEqual(f.get(1.0).version, "1.0")
+
+    def test_default_is_min_version(self):
+        f = NexusFactory(min_version="2.0")
+        self.assertIs(f.get(), f.get("2.0"))
+        self.assertEqual(f.get().version, "2.0")
+
+    def test_factories_do_not_share_cache(self):
+        self.assertIsNot(NexusFactory().get("1.0"), NexusFactory().get("1.0"))
+
+
+if __name__ == "__main__":
+    unittest.main()